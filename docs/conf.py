@@ -9,8 +9,9 @@ https://www.sphinx-doc.org/en/master/usage/configuration.html
 
 from __future__ import annotations
 
+import os
 import sys
-from datetime import date
+from datetime import date, datetime, timezone
 from pathlib import Path
 
 from packaging.version import parse as parse_version
@@ -27,8 +28,15 @@ else:
 with Path("../pyproject.toml").open("rb") as f:
     pkg_meta: dict[str, str] = toml_parse(f)["tool"]["poetry"]
 
+# Respect SOURCE_DATE_EPOCH (see https://reproducible-builds.org/specs/source-date-epoch/) if it's set,
+# so that the config values (and with them the sphinx environment cache) don't depend on when we're building
+if "SOURCE_DATE_EPOCH" in os.environ:
+    build_date = datetime.fromtimestamp(int(os.environ["SOURCE_DATE_EPOCH"]), tz=timezone.utc).date()
+else:
+    build_date = date.today()
+
 project = str(pkg_meta["name"])
-copyright = f"{date.today().year}, ItsDrike"  # noqa: A001
+copyright = f"{build_date.year}, ItsDrike"  # noqa: A001
 author = "ItsDrike"
 
 parsed_version = parse_version(pkg_meta["version"])
@@ -199,6 +207,9 @@ def override_towncrier_draft_format() -> None:
     from sphinx.util.nodes import nodes
 
     orig_f = sphinxcontrib.towncrier.ext._nodes_from_document_markup_source
+    # Creating the converter is fairly expensive (it builds the markdown parser along with
+    # its renderer), so only do it once, rather than for every converted draft
+    md_to_rst = m2r2.M2R()
 
     def override_f(
         state: statemachine.State,
@@ -212,7 +223,7 @@ def override_towncrier_draft_format() -> None:
             markup_source = markup_source[:-3]
 
         markup_source = markup_source.rstrip(" \n")
-        markup_source = m2r2.M2R()(markup_source)
+        markup_source = md_to_rst(markup_source)
 
         return orig_f(state, markup_source)
 
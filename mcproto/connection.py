@@ -7,7 +7,6 @@ from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
 import asyncio_dgram
-from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from typing_extensions import ParamSpec, Self, override
 
@@ -62,7 +61,7 @@ class SyncConnection(BaseSyncReader, BaseSyncWriter, ABC):
 
         self.encryption_enabled = True
         self.shared_secret = shared_secret
-        self.cipher = Cipher(algorithms.AES(shared_secret), modes.CFB8(shared_secret), backend=default_backend())
+        self.cipher = Cipher(algorithms.AES(shared_secret), modes.CFB8(shared_secret))
         self.encryptor = self.cipher.encryptor()
         self.decryptor = self.cipher.decryptor()
 
@@ -176,7 +175,7 @@ class AsyncConnection(BaseAsyncReader, BaseAsyncWriter, ABC):
 
         self.encryption_enabled = True
         self.shared_secret = shared_secret
-        self.cipher = Cipher(algorithms.AES(shared_secret), modes.CFB8(shared_secret), backend=default_backend())
+        self.cipher = Cipher(algorithms.AES(shared_secret), modes.CFB8(shared_secret))
         self.encryptor = self.cipher.encryptor()
         self.decryptor = self.cipher.decryptor()
 
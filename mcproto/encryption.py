@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import os
 
-from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric.padding import PKCS1v15
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey, RSAPublicKey, generate_private_key
 
@@ -43,7 +42,6 @@ def generate_rsa_key() -> RSAPrivateKey:  # pragma: no cover
     return generate_private_key(
         public_exponent=65537,
         key_size=1024,  # noqa: S505  # 1024-bit keys are not secure, but well, the mc protocol uses them
-        backend=default_backend(),
     )
 
 
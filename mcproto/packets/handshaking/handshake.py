@@ -22,6 +22,11 @@ class NextState(IntEnum):
     LOGIN = 2
 
 
+# Precomputed value -> member lookup, used instead of building the reverse mapping (or going
+# through the slower enum constructor) on every Handshake initialization
+_NEXT_STATE_LOOKUP: dict[int, NextState] = {member.value: member for member in NextState}
+
+
 @final
 class Handshake(ServerBoundPacket):
     """Initializes connection between server and client. (Client -> Server)."""
@@ -47,9 +52,8 @@ class Handshake(ServerBoundPacket):
         :param next_state: The next state for the server to move into.
         """
         if not isinstance(next_state, NextState):  # next_state is int
-            rev_lookup = {x.value: x for x in NextState.__members__.values()}
             try:
-                next_state = rev_lookup[next_state]
+                next_state = _NEXT_STATE_LOOKUP[next_state]
             except KeyError as exc:
                 raise ValueError("No such next_state.") from exc
 
@@ -42,9 +42,27 @@ T_Packet = TypeVar("T_Packet", bound=Packet)
 # Since the read functions here require PACKET_MAP, we can't move these functions
 # directly into BaseWriter/BaseReader classes, as that would be a circular import
 
+# Packet ids are constant for each packet class, cache their (varint) encoded form, so that
+# it doesn't need to be encoded again for every written packet. This is filled on demand
+_PACKET_ID_VARINTS: dict[int, bytes] = {}
 
-def _serialize_packet(packet: Packet, *, compression_threshold: int = -1) -> Buffer:
-    """Serialize the internal packet data, along with it's packet id.
+
+def _encode_packet_id(packet_id: int) -> bytes:
+    """Get the varint encoded packet id, using the cached value if available."""
+    try:
+        return _PACKET_ID_VARINTS[packet_id]
+    except KeyError:
+        buf = Buffer()
+        buf.write_varint(packet_id)
+        encoded = _PACKET_ID_VARINTS[packet_id] = bytes(buf)
+        return encoded
+
+
+def _serialize_packet_parts(packet: Packet, *, compression_threshold: int = -1) -> tuple[bytes, bytes | Buffer]:
+    """Serialize the packet into a (short) header and the packet data.
+
+    Keeping these separate allows the callers to build the final buffer (possibly with additional
+    prefixes) at once, rather than inserting the header in front of already written data.
 
     :param packet: The packet to serialize.
     :param compression_threshold:
@@ -52,29 +70,42 @@ def _serialize_packet(packet: Packet, *, compression_threshold: int = -1) -> Buf
         be enabeld. To disable compression, set this to -1. Note that when enabled, even if
         the threshold isn't crossed, the packet format will be different than with compression
         disabled.
+    :return:
+        A tuple of the header (data length, if compression is enabled and packet id) and the data.
+        Note that the data could be the buffer obtained from the packet, which shouldn't be modified.
     """
+    packet_id = _encode_packet_id(packet.PACKET_ID)
     packet_data = packet.serialize()
 
-    # Base packet buffer should only contain packet id and internal packet data
-    packet_buf = Buffer()
-    packet_buf.write_varint(packet.PACKET_ID)
-    packet_buf.write(packet_data)
-
     # Compression is enabled
     if compression_threshold >= 0:
         # Only run the actual compression step if we cross the threshold, otherwise
         # send uncompressed data with an extra 0 for data length
-        if len(packet_buf) > compression_threshold:
-            data_length = len(packet_buf)
-            packet_buf = Buffer(zlib.compress(packet_buf))
-        else:
-            data_length = 0
+        data_length = len(packet_id) + len(packet_data)
+        if data_length > compression_threshold:
+            data_length_buf = Buffer()
+            data_length_buf.write_varint(data_length)
+            return bytes(data_length_buf), zlib.compress(packet_id + packet_data)
 
-        data_buf = Buffer()
-        data_buf.write_varint(data_length)
-        data_buf.write(packet_buf)
-        return data_buf
-    return packet_buf
+        return b"\x00" + packet_id, packet_data  # data_length of 0 (varint)
+
+    return packet_id, packet_data
+
+
+def _serialize_packet_frame(packet: Packet, *, compression_threshold: int = -1) -> Buffer:
+    """Serialize the packet (see :func:`_serialize_packet_parts`), prefixed with it's length.
+
+    The returned buffer holds the whole packet, ready to be sent with a single write call, rather
+    than writing the length prefix and the packet data separately (with connections, each write
+    call can mean a separate send call on the underlying socket).
+    """
+    header, data = _serialize_packet_parts(packet, compression_threshold=compression_threshold)
+    # The whole header (packet length + the rest) is written first, so the data only gets copied once
+    frame_buf = Buffer()
+    frame_buf.write_varint(len(header) + len(data))
+    frame_buf.write(header)
+    frame_buf.write(data)
+    return frame_buf
 
 
 def _deserialize_packet(
@@ -85,6 +116,9 @@ def _deserialize_packet(
 ) -> T_Packet:
     """Deserialize the packet id and it's internal data.
 
+    :param buf:
+        Buffer holding the packet data (without the packet length). Note that this buffer will be
+        consumed and modified in the process, so it shouldn't be used after this function is called.
     :param packet_map:
         A mapping of packet id (int) -> packet. Should hold all possible packets for the
         current gamestate and direction. See :func:`~mcproto.packets.packet_map.generate_packet_map`
@@ -99,15 +133,19 @@ def _deserialize_packet(
     """
     if compressed:
         data_length = buf.read_varint()
-        packet_data = buf.read(buf.remaining)
         # Only run decompression if the threshold was crosed, otherwise the data_length will be
         # set to 0, indicating no compression was done, read the data normally if that's the case
-        buf = Buffer(zlib.decompress(packet_data)) if data_length != 0 else Buffer(packet_data)
+        if data_length != 0:
+            buf = Buffer(zlib.decompress(buf.read(buf.remaining)))
 
     packet_id = buf.read_varint()
-    packet_data = buf.read(buf.remaining)
+    packet_class = packet_map[packet_id]
 
-    return packet_map[packet_id].deserialize(Buffer(packet_data))
+    # Rather than copying the packet data over into a new buffer, just drop the already read
+    # part (packet id and data length) from this one. Removing data from the start of a bytearray
+    # doesn't need to move the rest of it, so this is a lot cheaper than copying the whole packet.
+    buf.clear(only_already_read=True)
+    return packet_class.deserialize(buf)
 
 
 def sync_write_packet(
@@ -126,8 +164,8 @@ def sync_write_packet(
         You can get this number from :class:`~mcproto.packets.login.login.LoginSetCompression` packet.
         If this packet wasn't sent by the server, set this to -1 (default).
     """
-    data_buf = _serialize_packet(packet, compression_threshold=compression_threshold)
-    writer.write_bytearray(data_buf)
+    data_buf = _serialize_packet_frame(packet, compression_threshold=compression_threshold)
+    writer.write(data_buf)
 
 
 async def async_write_packet(
@@ -146,8 +184,8 @@ async def async_write_packet(
         You can get this number from :class:`~mcproto.packets.login.login.LoginSetCompression` packet.
         If this packet wasn't sent by the server, set this to -1 (default).
     """
-    data_buf = _serialize_packet(packet, compression_threshold=compression_threshold)
-    await writer.write_bytearray(data_buf)
+    data_buf = _serialize_packet_frame(packet, compression_threshold=compression_threshold)
+    await writer.write(data_buf)
 
 
 def sync_read_packet(
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import ClassVar, cast, final
 
-from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
 from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat, load_der_public_key
 from typing_extensions import Self, override
@@ -23,6 +22,11 @@ __all__ = [
     "LoginSetCompression",
 ]
 
+# Server id sent by servers on minecraft 1.7.X and higher (see LoginEncryptionRequest), along with its
+# pre-encoded form (varint length prefix + UTF-8 data), as written by write_utf
+_DEFAULT_SERVER_ID = " " * 20
+_DEFAULT_SERVER_ID_ENCODED = bytes((len(_DEFAULT_SERVER_ID),)) + _DEFAULT_SERVER_ID.encode("utf-8")
+
 
 @final
 class LoginStart(ServerBoundPacket):
@@ -46,7 +50,7 @@ class LoginStart(ServerBoundPacket):
     def serialize(self) -> Buffer:
         buf = Buffer()
         buf.write_utf(self.username)
-        buf.extend(self.uuid.serialize())
+        buf.write(self.uuid.bytes)  # Same as UUID.serialize, without the temporary buffer
         return buf
 
     @override
@@ -61,7 +65,7 @@ class LoginStart(ServerBoundPacket):
 class LoginEncryptionRequest(ClientBoundPacket):
     """Used by the server to ask the client to encrypt the login process. (Server -> Client)."""
 
-    __slots__ = ("server_id", "public_key", "verify_token")
+    __slots__ = ("server_id", "_public_key", "_public_key_der", "verify_token")
 
     PACKET_ID: ClassVar[int] = 0x01
     GAME_STATE: ClassVar[GameState] = GameState.LOGIN
@@ -74,19 +78,41 @@ class LoginEncryptionRequest(ClientBoundPacket):
         :param verify_token: Sequence of random bytes generated by server for verification.
         """
         if server_id is None:
-            server_id = " " * 20
+            server_id = _DEFAULT_SERVER_ID
 
         self.server_id = server_id
         self.public_key = public_key
         self.verify_token = verify_token
 
+    @property
+    def public_key(self) -> RSAPublicKey:
+        """Server's public key."""
+        return self._public_key
+
+    @public_key.setter
+    def public_key(self, public_key: RSAPublicKey) -> None:
+        self._public_key = public_key
+        # DER encoded form of the key, only obtained once it's first needed (see _get_public_key_der)
+        self._public_key_der: bytes | None = None
+
+    def _get_public_key_der(self) -> bytes:
+        """Get the DER encoded public key, only encoding it once (on first use)."""
+        if self._public_key_der is None:
+            self._public_key_der = self._public_key.public_bytes(
+                encoding=Encoding.DER,
+                format=PublicFormat.SubjectPublicKeyInfo,
+            )
+        return self._public_key_der
+
     @override
     def serialize(self) -> Buffer:
-        public_key_raw = self.public_key.public_bytes(encoding=Encoding.DER, format=PublicFormat.SubjectPublicKeyInfo)
-
-        buf = Buffer()
-        buf.write_utf(self.server_id)
-        buf.write_bytearray(public_key_raw)
+        if self.server_id == _DEFAULT_SERVER_ID:
+            # Common case, we can skip the string encoding
+            buf = Buffer(_DEFAULT_SERVER_ID_ENCODED)
+        else:
+            buf = Buffer()
+            buf.write_utf(self.server_id)
+        buf.write_bytearray(self._get_public_key_der())
         buf.write_bytearray(self.verify_token)
         return buf
 
@@ -99,9 +125,12 @@ class LoginEncryptionRequest(ClientBoundPacket):
 
         # Key type is determined by the passed key itself, we know in our case, it will
         # be an RSA public key, so we explicitly type-cast here.
-        public_key = cast(RSAPublicKey, load_der_public_key(public_key_raw, default_backend()))
+        public_key = cast(RSAPublicKey, load_der_public_key(public_key_raw))
 
-        return cls(server_id=server_id, public_key=public_key, verify_token=verify_token)
+        packet = cls(server_id=server_id, public_key=public_key, verify_token=verify_token)
+        # We already have the DER encoded key, no need to encode it again if this packet gets re-serialized
+        packet._public_key_der = bytes(public_key_raw)
+        return packet
 
 
 @final
@@ -158,7 +187,7 @@ class LoginSuccess(ClientBoundPacket):
     @override
     def serialize(self) -> Buffer:
         buf = Buffer()
-        buf.extend(self.uuid.serialize())
+        buf.write(self.uuid.bytes)  # Same as UUID.serialize, without the temporary buffer
         buf.write_utf(self.username)
         return buf
 
@@ -263,7 +292,8 @@ class LoginPluginResponse(ServerBoundPacket):
     @classmethod
     def _deserialize(cls, buf: Buffer, /) -> Self:
         message_id = buf.read_varint()
-        data = buf.read_optional(lambda: buf.read(buf.remaining))
+        # Same as buf.read_optional(lambda: buf.read(buf.remaining)), without creating a new closure on each call
+        data = buf.read(buf.remaining) if buf.read(1)[0] else None
         return cls(message_id, data)
 
 
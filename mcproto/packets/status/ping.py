@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import struct
 from typing import ClassVar, final
 
 from typing_extensions import Self, override
 
 from mcproto.buffer import Buffer
 from mcproto.packets.packet import ClientBoundPacket, GameState, ServerBoundPacket
-from mcproto.protocol.base_io import StructFormat
 
 __all__ = ["PingPong"]
 
+# The packet only holds a single fixed-size field, so we can skip going through
+# write_value/read_value (StructFormat.LONGLONG) and use a pre-compiled struct directly
+_PAYLOAD_STRUCT = struct.Struct(">q")
+
 
 @final
 class PingPong(ClientBoundPacket, ServerBoundPacket):
@@ -31,12 +35,10 @@ class PingPong(ClientBoundPacket, ServerBoundPacket):
 
     @override
     def serialize(self) -> Buffer:
-        buf = Buffer()
-        buf.write_value(StructFormat.LONGLONG, self.payload)
-        return buf
+        return Buffer(_PAYLOAD_STRUCT.pack(self.payload))
 
     @override
     @classmethod
     def _deserialize(cls, buf: Buffer, /) -> Self:
-        payload = buf.read_value(StructFormat.LONGLONG)
+        (payload,) = _PAYLOAD_STRUCT.unpack(buf.read(_PAYLOAD_STRUCT.size))
         return cls(payload)
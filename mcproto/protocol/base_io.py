@@ -4,7 +4,6 @@ import struct
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable
 from enum import Enum
-from itertools import count
 from typing import Literal, TypeVar, Union, overload
 
 from typing_extensions import TypeAlias
@@ -71,6 +70,13 @@ FLOAT_FORMATS_TYPE: TypeAlias = Union[
     Literal[StructFormat.HALFFLOAT],
 ]
 
+# Pre-compiled big-endian structs for every format, so that write_value/read_value don't need to
+# rebuild the format string (and have it looked up in struct's internal cache) on each call
+_STRUCTS: dict[StructFormat, struct.Struct] = {fmt: struct.Struct(">" + fmt.value) for fmt in StructFormat}
+
+# Pre-made single byte values, so that writing these doesn't need to create a new bytes object each time
+_SINGLE_BYTES: tuple[bytes, ...] = tuple(bytes((i,)) for i in range(256))
+
 # endregion
 
 # region: Writer classes
@@ -102,7 +108,7 @@ class BaseAsyncWriter(ABC):
 
     async def write_value(self, fmt: StructFormat, value: object, /) -> None:
         """Write a given ``value`` as given struct format (``fmt``) in big-endian mode."""
-        await self.write(struct.pack(">" + fmt.value, value))
+        await self.write(_STRUCTS[fmt].pack(value))
 
     async def _write_varuint(self, value: int, /, *, max_bits: int | None = None) -> None:
         """Write an arbitrarily big unsigned integer in a variable length format.
@@ -122,21 +128,28 @@ class BaseAsyncWriter(ABC):
         if value < 0 or value > value_max:
             raise ValueError(f"Tried to write varint outside of the range of {max_bits}-bit int.")
 
+        # Build up all of the varint bytes first, so that they can be sent with a single write call
+        data = bytearray()
         remaining = value
-        while True:
-            if remaining & ~0x7F == 0:  # final byte
-                await self.write_value(StructFormat.UBYTE, remaining)
-                return
-            # Write only 7 least significant bits with the first bit being 1, marking there will be another byte
-            await self.write_value(StructFormat.UBYTE, remaining & 0x7F | 0x80)
-            # Subtract the value we've already sent (7 least significant bits)
+        while remaining & ~0x7F != 0:
+            # Store only 7 least significant bits with the first bit being 1, marking there will be another byte
+            data.append(remaining & 0x7F | 0x80)
+            # Subtract the value we've already stored (7 least significant bits)
             remaining >>= 7
+        data.append(remaining)  # final byte
+        await self.write(data)
 
     async def write_varint(self, value: int, /) -> None:
         """Write a 32-bit signed integer in a variable length format.
 
         For more information about variable length format check :meth:`._write_varuint`.
         """
+        if 0 <= value < 0x80:
+            # Fast path for small non-negative values (most packet ids, lengths, ...), which are the same
+            # in twos complement and take up just a single varint byte, so we can write them directly
+            await self.write(_SINGLE_BYTES[value])
+            return
+
         val = to_twos_complement(value, bits=32)
         await self._write_varuint(val, max_bits=32)
 
@@ -155,9 +168,8 @@ class BaseAsyncWriter(ABC):
 
     async def write_ascii(self, value: str, /) -> None:
         """Write ISO-8859-1 encoded string, with NULL (0x00) at the end to indicate string end."""
-        data = bytearray(value, "ISO-8859-1")
-        await self.write(data)
-        await self.write(bytearray.fromhex("00"))
+        # Write the data along with the NULL terminator at once
+        await self.write(value.encode("ISO-8859-1") + b"\x00")
 
     async def write_utf(self, value: str, /) -> None:
         """Write a UTF-8 encoded string, prefixed with a varint of it's size (in bytes).
@@ -174,7 +186,8 @@ class BaseAsyncWriter(ABC):
         if len(value) > 32767:
             raise ValueError("Maximum character limit for writing strings is 32767 characters.")
 
-        data = bytearray(value, "utf-8")
+        # str.encode is notably faster than bytearray(value, "utf-8"), and it's a plain copy for ASCII-only strings
+        data = value.encode("utf-8")
         await self.write_varint(len(data))
         await self.write(data)
 
@@ -186,10 +199,10 @@ class BaseAsyncWriter(ABC):
           and the return value is forwarded.
         """
         if value is None:
-            await self.write_value(StructFormat.BOOL, False)
+            await self.write(b"\x00")  # False
             return None
 
-        await self.write_value(StructFormat.BOOL, True)
+        await self.write(b"\x01")  # True
         return await writer(value)
 
 
@@ -219,7 +232,7 @@ class BaseSyncWriter(ABC):
 
     def write_value(self, fmt: StructFormat, value: object, /) -> None:
         """Write a given ``value`` as given struct format (``fmt``) in big-endian mode."""
-        self.write(struct.pack(">" + fmt.value, value))
+        self.write(_STRUCTS[fmt].pack(value))
 
     def _write_varuint(self, value: int, /, *, max_bits: int | None = None) -> None:
         """Write an arbitrarily big unsigned integer in a variable length format.
@@ -239,21 +252,28 @@ class BaseSyncWriter(ABC):
         if value < 0 or value > value_max:
             raise ValueError(f"Tried to write varint outside of the range of {max_bits}-bit int.")
 
+        # Build up all of the varint bytes first, so that they can be sent with a single write call
+        data = bytearray()
         remaining = value
-        while True:
-            if remaining & ~0x7F == 0:  # final byte
-                self.write_value(StructFormat.UBYTE, remaining)
-                return
-            # Write only 7 least significant bits with the first bit being 1, marking there will be another byte
-            self.write_value(StructFormat.UBYTE, remaining & 0x7F | 0x80)
-            # Subtract the value we've already sent (7 least significant bits)
+        while remaining & ~0x7F != 0:
+            # Store only 7 least significant bits with the first bit being 1, marking there will be another byte
+            data.append(remaining & 0x7F | 0x80)
+            # Subtract the value we've already stored (7 least significant bits)
             remaining >>= 7
+        data.append(remaining)  # final byte
+        self.write(data)
 
     def write_varint(self, value: int, /) -> None:
         """Write a 32-bit signed integer in a variable length format.
 
         For more information about variable length format check :meth:`._write_varuint`.
         """
+        if 0 <= value < 0x80:
+            # Fast path for small non-negative values (most packet ids, lengths, ...), which are the same
+            # in twos complement and take up just a single varint byte, so we can write them directly
+            self.write(_SINGLE_BYTES[value])
+            return
+
         val = to_twos_complement(value, bits=32)
         self._write_varuint(val, max_bits=32)
 
@@ -272,9 +292,8 @@ class BaseSyncWriter(ABC):
 
     def write_ascii(self, value: str, /) -> None:
         """Write ISO-8859-1 encoded string, with NULL (0x00) at the end to indicate string end."""
-        data = bytearray(value, "ISO-8859-1")
-        self.write(data)
-        self.write(bytearray.fromhex("00"))
+        # Write the data along with the NULL terminator at once
+        self.write(value.encode("ISO-8859-1") + b"\x00")
 
     def write_utf(self, value: str, /) -> None:
         """Write a UTF-8 encoded string, prefixed with a varint of it's size (in bytes).
@@ -291,7 +310,8 @@ class BaseSyncWriter(ABC):
         if len(value) > 32767:
             raise ValueError("Maximum character limit for writing strings is 32767 characters.")
 
-        data = bytearray(value, "utf-8")
+        # str.encode is notably faster than bytearray(value, "utf-8"), and it's a plain copy for ASCII-only strings
+        data = value.encode("utf-8")
         self.write_varint(len(data))
         self.write(data)
 
@@ -303,10 +323,10 @@ class BaseSyncWriter(ABC):
           and the return value is forwarded.
         """
         if value is None:
-            self.write_value(StructFormat.BOOL, False)
+            self.write(b"\x00")  # False
             return None
 
-        self.write_value(StructFormat.BOOL, True)
+        self.write(b"\x01")  # True
         return writer(value)
 
 
@@ -343,10 +363,9 @@ class BaseAsyncReader(ABC):
 
         The amount of bytes to read will be determined based on the struct format automatically.
         """
-        length = struct.calcsize(fmt.value)
-        data = await self.read(length)
-        unpacked = struct.unpack(">" + fmt.value, data)
-        return unpacked[0]
+        fmt_struct = _STRUCTS[fmt]
+        data = await self.read(fmt_struct.size)
+        return fmt_struct.unpack(data)[0]
 
     async def _read_varuint(self, *, max_bits: int | None = None) -> int:
         """Read an arbitrarily big unsigned integer in a variable length format.
@@ -364,21 +383,28 @@ class BaseAsyncReader(ABC):
         """
         value_max = (1 << (max_bits)) - 1 if max_bits is not None else float("inf")
 
-        result = 0
-        for i in count():
-            byte = await self.read_value(StructFormat.UBYTE)
-            # Read 7 least significant value bits in this byte, and shift them appropriately to be in the right place
-            # then simply add them (OR) as additional 7 most significant bits in our result
-            result |= (byte & 0x7F) << (7 * i)
+        # Index the single read byte directly, rather than going through read_value(StructFormat.UBYTE)
+        byte = (await self.read(1))[0]
+        # Read 7 least significant value bits in this byte, these are the least significant bits of the result
+        result = byte & 0x7F
+        shift = 7
 
+        # Keep reading while the most significant (continuation) bit is set. Most varints (packet ids, lengths, ...)
+        # are small enough to fit into a single byte, in which case we never even enter this loop.
+        while byte & 0x80:
             # Ensure that we stop reading and raise an error if the size gets over the maximum
             # (if the current amount of bits is higher than allowed size in bits)
             if result > value_max:
                 raise IOError(f"Received varint was outside the range of {max_bits}-bit int.")
 
-            # If the most significant bit is 0, we should stop reading
-            if not byte & 0x80:
-                break
+            byte = (await self.read(1))[0]
+            # Read 7 least significant value bits in this byte, and shift them appropriately to be in the right place
+            # then simply add them (OR) as additional 7 most significant bits in our result
+            result |= (byte & 0x7F) << shift
+            shift += 7
+
+        if result > value_max:
+            raise IOError(f"Received varint was outside the range of {max_bits}-bit int.")
 
         return result
 
@@ -405,12 +431,14 @@ class BaseAsyncReader(ABC):
 
     async def read_ascii(self) -> str:
         """Read ISO-8859-1 encoded string, until we encounter NULL (0x00) at the end indicating string end."""
-        # Keep reading bytes until we find NULL
+        # Keep reading bytes until we find NULL (which isn't included in the result)
+        read = self.read
         result = bytearray()
-        while len(result) == 0 or result[-1] != 0:
-            byte = await self.read(1)
-            result.extend(byte)
-        return result[:-1].decode("ISO-8859-1")
+        while True:
+            byte = await read(1)
+            if byte[0] == 0:
+                return result.decode("ISO-8859-1")
+            result += byte
 
     async def read_utf(self) -> str:
         """Read a UTF-8 encoded string, prefixed with a varint of it's size (in bytes).
@@ -447,7 +475,9 @@ class BaseAsyncReader(ABC):
         * When ``False`` is read, the function will not read anything and ``None`` is returned.
         * When ``True`` is read, the ``reader`` function is called, and it's return value is forwarded.
         """
-        if not await self.read_value(StructFormat.BOOL):
+        # Any non-zero byte is treated as True (same as with StructFormat.BOOL), but there's no need to go
+        # through read_value and struct unpacking just to check a single byte
+        if not (await self.read(1))[0]:
             return None
 
         return await reader()
@@ -482,10 +512,9 @@ class BaseSyncReader(ABC):
 
         The amount of bytes to read will be determined based on the struct format automatically.
         """
-        length = struct.calcsize(fmt.value)
-        data = self.read(length)
-        unpacked = struct.unpack(">" + fmt.value, data)
-        return unpacked[0]
+        fmt_struct = _STRUCTS[fmt]
+        data = self.read(fmt_struct.size)
+        return fmt_struct.unpack(data)[0]
 
     def _read_varuint(self, *, max_bits: int | None = None) -> int:
         """Read an arbitrarily big unsigned integer in a variable length format.
@@ -503,21 +532,28 @@ class BaseSyncReader(ABC):
         """
         value_max = (1 << (max_bits)) - 1 if max_bits is not None else float("inf")
 
-        result = 0
-        for i in count():
-            byte = self.read_value(StructFormat.UBYTE)
-            # Read 7 least significant value bits in this byte, and shift them appropriately to be in the right place
-            # then simply add them (OR) as additional 7 most significant bits in our result
-            result |= (byte & 0x7F) << (7 * i)
+        # Index the single read byte directly, rather than going through read_value(StructFormat.UBYTE)
+        byte = self.read(1)[0]
+        # Read 7 least significant value bits in this byte, these are the least significant bits of the result
+        result = byte & 0x7F
+        shift = 7
 
+        # Keep reading while the most significant (continuation) bit is set. Most varints (packet ids, lengths, ...)
+        # are small enough to fit into a single byte, in which case we never even enter this loop.
+        while byte & 0x80:
             # Ensure that we stop reading and raise an error if the size gets over the maximum
             # (if the current amount of bits is higher than allowed size in bits)
             if result > value_max:
                 raise IOError(f"Received varint was outside the range of {max_bits}-bit int.")
 
-            # If the most significant bit is 0, we should stop reading
-            if not byte & 0x80:
-                break
+            byte = self.read(1)[0]
+            # Read 7 least significant value bits in this byte, and shift them appropriately to be in the right place
+            # then simply add them (OR) as additional 7 most significant bits in our result
+            result |= (byte & 0x7F) << shift
+            shift += 7
+
+        if result > value_max:
+            raise IOError(f"Received varint was outside the range of {max_bits}-bit int.")
 
         return result
 
@@ -544,12 +580,14 @@ class BaseSyncReader(ABC):
 
     def read_ascii(self) -> str:
         """Read ISO-8859-1 encoded string, until we encounter NULL (0x00) at the end indicating string end."""
-        # Keep reading bytes until we find NULL
+        # Keep reading bytes until we find NULL (which isn't included in the result)
+        read = self.read
         result = bytearray()
-        while len(result) == 0 or result[-1] != 0:
-            byte = self.read(1)
-            result.extend(byte)
-        return result[:-1].decode("ISO-8859-1")
+        while True:
+            byte = read(1)
+            if byte[0] == 0:
+                return result.decode("ISO-8859-1")
+            result += byte
 
     def read_utf(self) -> str:
         """Read a UTF-8 encoded string, prefixed with a varint of it's size (in bytes).
@@ -586,7 +624,9 @@ class BaseSyncReader(ABC):
         * When ``False`` is read, the function will not read anything and ``None`` is returned.
         * When ``True`` is read, the ``reader`` function is called, and it's return value is forwarded.
         """
-        if not self.read_value(StructFormat.BOOL):
+        # Any non-zero byte is treated as True (same as with StructFormat.BOOL), but there's no need to go
+        # through read_value and struct unpacking just to check a single byte
+        if not self.read(1)[0]:
             return None
 
         return reader()
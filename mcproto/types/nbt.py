@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import struct
 import warnings
 from abc import ABCMeta
 from enum import IntEnum
@@ -142,6 +143,60 @@ class NBTagType(IntEnum):
     LONG_ARRAY = 12
 
 
+# Precomputed value -> member lookup, used instead of going through the (slower) enum constructor
+# for every read tag type
+_NBT_TAG_TYPE_LOOKUP: dict[int, NBTagType] = {member.value: member for member in NBTagType}
+
+# Serialized TAG_End (only the tag type, end tags don't have a name or a payload), marking the end of a compound
+_END_TAG = bytes((NBTagType.END,))
+
+# Length prefixes of the NBT payloads (signed short for strings, signed int for arrays)
+_SHORT_STRUCT = struct.Struct(">h")
+_INT_STRUCT = struct.Struct(">i")
+
+# Fixed-size prefix of the ListNBT payload: tag type of the items (byte) + length of the list (signed int)
+_LIST_PREFIX_STRUCT = struct.Struct(">bi")
+
+# Struct format characters for the payloads of fixed-size numeric tags, used to write lists of these tags at once
+_LIST_ITEM_FORMATS: dict[NBTagType, str] = {
+    NBTagType.BYTE: "b",
+    NBTagType.SHORT: "h",
+    NBTagType.INT: "i",
+    NBTagType.LONG: "q",
+    NBTagType.FLOAT: "f",
+    NBTagType.DOUBLE: "d",
+}
+
+
+def _encode_string(value: str) -> bytes:
+    """Encode a TAG_String payload (UTF-8 data prefixed with its length), without creating the tag objects.
+
+    This is used for writing the names of the tags, as well as the StringNBT payload.
+    """
+    data = value.encode("utf-8")
+    if len(data) >= 1 << 15:
+        raise OverflowError("String is too long to be encoded (more than 32767 bytes).")
+    return _SHORT_STRUCT.pack(len(data)) + data
+
+
+def _read_string(buf: Buffer) -> str:
+    """Read a TAG_String payload (length prefixed UTF-8 string), without creating the tag objects.
+
+    This is used for reading the names of the tags, as well as the StringNBT payload.
+    """
+    try:
+        (length,) = _SHORT_STRUCT.unpack(buf.read(2))
+    except IOError:
+        raise IOError("Buffer does not contain enough data to read a string.") from None
+
+    if length < 0:
+        raise ValueError("Invalid string length.")
+
+    if buf.remaining < length:
+        raise IOError("Buffer does not contain enough data to read the string.")
+    return buf.read(length).decode("utf-8")
+
+
 PayloadType: TypeAlias = Union[
     int,
     float,
@@ -204,7 +259,9 @@ class NBTag(MCType, metaclass=_MetaNBTag):
         if with_name:
             if not self.name:
                 raise ValueError("Named tags must have a name.")
-            StringNBT(self.name).write_to(buf, with_type=False, with_name=False)
+            if len(self.name) > 32767:
+                raise ValueError("Maximum character limit for writing strings is 32767 characters.")
+            buf.write(_encode_string(self.name))
         return True
 
     def write_to(self, buf: Buffer, with_type: bool = True, with_name: bool = True) -> None:
@@ -254,16 +311,16 @@ class NBTag(MCType, metaclass=_MetaNBTag):
         tag_type: NBTagType = cls.TYPE  # default value
         if read_type:
             try:
-                tag_type = NBTagType(buf.read_value(StructFormat.BYTE))
+                tag_type = _NBT_TAG_TYPE_LOOKUP[buf.read_value(StructFormat.BYTE)]
             except OSError:
                 raise IOError("Buffer is empty.") from None
-            except ValueError:
+            except KeyError:
                 raise TypeError("Invalid tag type.") from None
 
         if tag_type == NBTagType.END:
             return "", tag_type
 
-        name = StringNBT.read_from(buf, with_type=False, with_name=False).value if with_name else ""
+        name = _read_string(buf) if with_name else ""
 
         return name, tag_type
 
@@ -338,16 +395,17 @@ class NBTag(MCType, metaclass=_MetaNBTag):
                 # Type END is used to mark an empty list
                 return ListNBT([], name=name)
             first_type = type(data[0])
-            if any(type(item) != first_type for item in data):
+            if set(map(type, data)) != {first_type}:
                 raise TypeError("All items in a list must be of the same type.")
 
             if issubclass(first_type, int) and use_int_array:
-                # Check the range of the integers in the list
-                use_int = all(-(1 << 31) <= item < 1 << 31 for item in data)
-                use_long = all(-(1 << 63) <= item < 1 << 63 for item in data)
-                if use_int:
+                # Check the range of the integers in the list, it's enough to only look at the
+                # extremes (min/max go over the list in C, unlike a per-item generator expression)
+                lowest, highest = min(data), max(data)
+                if lowest >= -(1 << 31) and highest < 1 << 31:
                     return IntArrayNBT(data, name=name)
-                if not use_long:  # Too big to fit in a long, won't fit in a List of Longs either
+                if lowest < -(1 << 63) or highest >= 1 << 63:
+                    # Too big to fit in a long, won't fit in a List of Longs either
                     raise ValueError("Integer list contains values out of range.")
                 return LongArrayNBT(data, name=name)
             return ListNBT([NBTag.from_object(item, use_int_array=use_int_array) for item in data], name=name)
@@ -816,7 +874,7 @@ class ByteArrayNBT(NBTag):
         :note: The length of the byte array is written as a signed 32-bit integer in big-endian format.
         """
         self._write_header(buf, with_type=with_type, with_name=with_name)
-        IntNBT(len(self.payload)).write_to(buf, with_type=False, with_name=False)
+        buf.write(_INT_STRUCT.pack(len(self.payload)))
         buf.write(self.payload)
 
     @classmethod
@@ -834,7 +892,7 @@ class ByteArrayNBT(NBTag):
         if tag_type != cls.TYPE:
             raise TypeError(f"Expected a {cls.TYPE.name} tag, but found a different tag ({tag_type.name}).")
         try:
-            length = IntNBT.read_from(buf, with_type=False, with_name=False).value
+            (length,) = _INT_STRUCT.unpack(buf.read(4))
         except IOError:
             raise IOError("Buffer does not contain enough data to read a byte array.") from None
 
@@ -899,9 +957,8 @@ class StringNBT(NBTag):
             # Check the length of the string (can't generate strings that long in tests)
             raise ValueError("Maximum character limit for writing strings is 32767 characters.")  # pragma: no cover
 
-        data = bytearray(self.payload, "utf-8")
-        ShortNBT(len(data)).write_to(buf, with_type=False, with_name=False)
-        buf.write(data)
+        # Write the length prefix along with the data at once
+        buf.write(_encode_string(self.payload))
 
     @classmethod
     def read_from(cls, buf: Buffer, with_type: bool = True, with_name: bool = True) -> StringNBT:
@@ -917,21 +974,7 @@ class StringNBT(NBTag):
         name, tag_type = cls._read_header(buf, read_type=with_type, with_name=with_name)
         if tag_type != cls.TYPE:
             raise TypeError(f"Expected a {cls.TYPE.name} tag, but found a different tag ({tag_type.name}).")
-        try:
-            length = ShortNBT.read_from(buf, with_type=False, with_name=False).value
-        except IOError:
-            raise IOError("Buffer does not contain enough data to read a string.") from None
-
-        if length < 0:
-            raise ValueError("Invalid string length.")
-
-        if buf.remaining < length:
-            raise IOError("Buffer does not contain enough data to read the string.")
-        data = buf.read(length)
-        try:
-            return StringNBT(data.decode("utf-8"), name=name)
-        except UnicodeDecodeError:
-            raise  # We want to know it
+        return StringNBT(_read_string(buf), name=name)
 
     def __str__(self) -> str:
         """Get the string value of the StringNBT tag."""
@@ -976,8 +1019,7 @@ class ListNBT(NBTag):
 
         if not self.payload:
             # Set the tag type to TAG_End if the list is empty
-            EndNBT().write_to(buf, with_name=False)
-            IntNBT(0).write_to(buf, with_name=False, with_type=False)
+            buf.write(_LIST_PREFIX_STRUCT.pack(NBTagType.END, 0))
             return
 
         if not all(isinstance(tag, NBTag) for tag in self.payload):  # type: ignore # We want to check anyway
@@ -987,14 +1029,26 @@ class ListNBT(NBTag):
             )
 
         tag_type = self.payload[0].TYPE
-        ByteNBT(tag_type).write_to(buf, with_name=False, with_type=False)
-        IntNBT(len(self.payload)).write_to(buf, with_name=False, with_type=False)
         for tag in self.payload:
             if tag_type != tag.TYPE:
                 raise ValueError(f"All tags in a list must be of the same type, got tag {tag!r}")
             if tag.name != "":
                 raise ValueError(f"All tags in a list must be unnamed, got tag {tag!r}")
 
+        buf.write(_LIST_PREFIX_STRUCT.pack(tag_type, len(self.payload)))
+
+        # Numeric tags only hold a fixed-size payload, write all of them with a single struct call
+        item_format = _LIST_ITEM_FORMATS.get(tag_type)
+        if item_format is not None:
+            try:
+                data = struct.pack(f">{len(self.payload)}{item_format}", *(tag.payload for tag in self.payload))
+            except struct.error:
+                pass  # Some of the values are invalid, let the tags themselves raise the appropriate error below
+            else:
+                buf.write(data)
+                return
+
+        for tag in self.payload:
             tag.write_to(buf, with_type=False, with_name=False)
 
     @classmethod
@@ -1011,9 +1065,8 @@ class ListNBT(NBTag):
         name, tag_type = cls._read_header(buf, read_type=with_type, with_name=with_name)
         if tag_type != cls.TYPE:
             raise TypeError(f"Expected a {cls.TYPE.name} tag, but found a different tag ({tag_type.name}).")
-        list_tag_type = ByteNBT.read_from(buf, with_type=False, with_name=False).payload
         try:
-            length = IntNBT.read_from(buf, with_type=False, with_name=False).value
+            list_tag_type, length = _LIST_PREFIX_STRUCT.unpack(buf.read(_LIST_PREFIX_STRUCT.size))
         except IOError:
             raise IOError("Buffer does not contain enough data to read a list.") from None
 
@@ -1021,18 +1074,19 @@ class ListNBT(NBTag):
             return ListNBT([], name=name)
 
         try:
-            list_tag_type = NBTagType(list_tag_type)
-        except ValueError:
+            list_tag_type = _NBT_TAG_TYPE_LOOKUP[list_tag_type]
+        except KeyError:
             raise TypeError(f"Unknown tag type {list_tag_type}.") from None
 
         list_type_class = NBTag.ASSOCIATED_TYPES.get(list_tag_type, NBTag)
         if list_type_class == NBTag:
             raise TypeError(f"Unknown tag type {list_tag_type}.")  # pragma: no cover
+        read_item = list_type_class.read_from
         try:
             payload = [
                 # The type is already known, so we don't need to read it again
                 # List items are unnamed, so we don't need to read the name
-                list_type_class.read_from(buf, with_type=False, with_name=False)
+                read_item(buf, with_type=False, with_name=False)
                 for _ in range(length)
             ]
         except IOError:
@@ -1084,7 +1138,7 @@ class CompoundNBT(NBTag):
         """
         self._write_header(buf, with_type=with_type, with_name=with_name)
         if not self.payload:
-            EndNBT().write_to(buf, with_name=False, with_type=True)
+            buf.write(_END_TAG)
             return
         if not all(isinstance(tag, NBTag) for tag in self.payload):  # type: ignore # We want to check anyway
             raise ValueError(
@@ -1100,7 +1154,7 @@ class CompoundNBT(NBTag):
 
         for tag in self.payload:
             tag.write_to(buf)
-        EndNBT().write_to(buf, with_name=False, with_type=True)
+        buf.write(_END_TAG)
 
     @classmethod
     def read_from(cls, buf: Buffer, with_type: bool = True, with_name: bool = True) -> CompoundNBT:
@@ -1117,13 +1171,18 @@ class CompoundNBT(NBTag):
         if tag_type != cls.TYPE:
             raise TypeError(f"Expected a {cls.TYPE.name} tag, but found a different tag ({tag_type.name}).")
 
+        # Avoid repeating these lookups for every child tag
+        read_header = cls._read_header
+        associated_types = NBTag.ASSOCIATED_TYPES
+        end_type = NBTagType.END
+
         payload = []
         while True:
-            child_name, child_type = cls._read_header(buf, with_name=True, read_type=True)
-            if child_type == NBTagType.END:
+            child_name, child_type = read_header(buf, with_name=True, read_type=True)
+            if child_type == end_type:
                 break
             # The name and type of the tag have already been read
-            tag = NBTag.ASSOCIATED_TYPES[child_type].read_from(buf, with_type=False, with_name=False)
+            tag = associated_types[child_type].read_from(buf, with_type=False, with_name=False)
             tag.name = child_name
             payload.append(tag)
         return CompoundNBT(payload, name=name)
@@ -1201,12 +1260,12 @@ class IntArrayNBT(NBTag):
         if any(not isinstance(item, int) for item in self.payload):  # type: ignore # We want to check anyway
             raise ValueError("All items in an integer array must be integers.")
 
-        if any(item < -(1 << 31) or item >= 1 << 31 for item in self.payload):
+        if self.payload and (min(self.payload) < -(1 << 31) or max(self.payload) >= 1 << 31):
             raise OverflowError("Integer array contains values out of range.")
 
-        IntNBT(len(self.payload)).write_to(buf, with_name=False, with_type=False)
-        for i in self.payload:
-            IntNBT(i).write_to(buf, with_name=False, with_type=False)
+        # Pack the length (signed 32-bit int) along with all of the items with a single struct call,
+        # rather than going through IntNBT for each one of them
+        buf.write(struct.pack(f">i{len(self.payload)}i", len(self.payload), *self.payload))
 
     @classmethod
     def read_from(cls, buf: Buffer, with_type: bool = True, with_name: bool = True) -> IntArrayNBT:
@@ -1222,9 +1281,14 @@ class IntArrayNBT(NBTag):
         name, tag_type = cls._read_header(buf, read_type=with_type, with_name=with_name)
         if tag_type != NBTagType.INT_ARRAY:
             raise TypeError(f"Expected an INT_ARRAY tag, but found a different tag ({tag_type}).")
-        length = IntNBT.read_from(buf, with_type=False, with_name=False).value
         try:
-            payload = [IntNBT.read_from(buf, with_type == NBTagType.INT, with_name=False).value for _ in range(length)]
+            (length,) = _INT_STRUCT.unpack(buf.read(4))
+        except IOError:
+            raise IOError("Buffer does not contain enough data to read an int.") from None
+        try:
+            # Read the whole array at once and unpack all of the items with a single struct call,
+            # rather than going through IntNBT for each one of them
+            payload = list(struct.unpack(f">{length}i", buf.read(length * 4))) if length > 0 else []
         except IOError:
             raise IOError(
                 "Buffer does not contain enough data to read the entire integer array. (Incomplete data)"
@@ -1280,12 +1344,12 @@ class LongArrayNBT(IntArrayNBT):
         if any(not isinstance(item, int) for item in self.payload):  # type: ignore # We want to check anyway
             raise ValueError(f"All items in a long array must be integers. ({self.payload})")
 
-        if any(item < -(1 << 63) or item >= 1 << 63 for item in self.payload):
+        if self.payload and (min(self.payload) < -(1 << 63) or max(self.payload) >= 1 << 63):
             raise OverflowError(f"Long array contains values out of range. ({self.payload})")
 
-        IntNBT(len(self.payload)).write_to(buf, with_name=False, with_type=False)
-        for i in self.payload:
-            LongNBT(i).write_to(buf, with_name=False, with_type=False)
+        # Pack the length (signed 32-bit int) along with all of the items with a single struct call,
+        # rather than going through LongNBT for each one of them
+        buf.write(struct.pack(f">i{len(self.payload)}q", len(self.payload), *self.payload))
 
     @classmethod
     def read_from(cls, buf: Buffer, with_type: bool = True, with_name: bool = True) -> LongArrayNBT:
@@ -1301,10 +1365,13 @@ class LongArrayNBT(IntArrayNBT):
         name, tag_type = cls._read_header(buf, read_type=with_type, with_name=with_name)
         if tag_type != NBTagType.LONG_ARRAY:
             raise TypeError(f"Expected a LONG_ARRAY tag, but found a different tag ({tag_type}).")
-        length = IntNBT.read_from(buf, with_type=False, with_name=False).payload
+        try:
+            (length,) = _INT_STRUCT.unpack(buf.read(4))
+        except IOError:
+            raise IOError("Buffer does not contain enough data to read an int.") from None
 
         try:
-            payload = [LongNBT.read_from(buf, with_type=False, with_name=False).payload for _ in range(length)]
+            payload = list(struct.unpack(f">{length}q", buf.read(length * 8))) if length > 0 else []
         except IOError:
             raise IOError(
                 "Buffer does not contain enough data to read the entire long array. (Incomplete data)"
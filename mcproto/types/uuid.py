@@ -23,11 +23,10 @@ class UUID(MCType, uuid.UUID):
 
     @override
     def serialize(self) -> Buffer:
-        buf = Buffer()
-        buf.write(self.bytes)
-        return buf
+        return Buffer(self.bytes)
 
     @override
     @classmethod
     def deserialize(cls, buf: Buffer, /) -> Self:
-        return cls(bytes=bytes(buf.read(16)))
+        # Going through int avoids copying the read bytearray into bytes (uuid.UUID converts it to int anyway)
+        return cls(int=int.from_bytes(buf.read(16), "big"))
@@ -30,15 +30,25 @@ class RequiredParamsABCMixin:
     This is often useful for classes that are expected to be slotted, as each subclass will need to define
     ``__slots__``, otherwise a ``__dict__`` will automatically be made for it. However this is entirely
     optional, and if :attr:`._REQUIRED_CLASS_VARS_NO_MRO` isn't set, this check is skipped.
+
+    The check is only performed on the first initialization of each concrete class, once it passes, the
+    class is marked as verified and any further initializations skip it entirely.
     """
 
     __slots__ = ()
 
     _REQUIRRED_CLASS_VARS: ClassVar[Sequence[str]]
     _REQUIRED_CLASS_VARS_NO_MRO: ClassVar[Sequence[str]]
+    _required_class_vars_verified: ClassVar[type | None] = None
 
     def __new__(cls: type[Self], *a, **kw) -> Self:
         """Enforce required parameters being set for each instance of the concrete classes."""
+        # This runs for every single packet instance, so only do the full check once per class.
+        # Comparing against the class itself (rather than using a bool) makes sure that a subclass
+        # doesn't inherit the verified state from its parent.
+        if cls._required_class_vars_verified is cls:
+            return super().__new__(cls)
+
         _err_msg = f"Can't instantiate abstract {cls.__name__} class without defining " + "{!r} classvar"
 
         _required_class_vars = getattr(cls, "_REQUIRED_CLASS_VARS", None)
@@ -51,6 +61,7 @@ class RequiredParamsABCMixin:
 
         _required_class_vars_no_mro = getattr(cls, "_REQUIRED_CLASS_VARS_NO_MRO", None)
         if _required_class_vars_no_mro is None:
+            cls._required_class_vars_verified = cls
             return super().__new__(cls)
 
         for req_no_mro_attr in _required_class_vars_no_mro:
@@ -60,6 +71,7 @@ class RequiredParamsABCMixin:
                     emsg += f" ({req_no_mro_attr} found in a subclass, but not explicitly in {cls.__name__})"
                 raise TypeError(emsg)
 
+        cls._required_class_vars_verified = cls
         return super().__new__(cls)
 
 
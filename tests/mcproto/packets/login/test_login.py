@@ -5,6 +5,7 @@ from typing import Any
 import pytest
 
 from mcproto.buffer import Buffer
+from mcproto.encryption import generate_rsa_key
 from mcproto.packets.login.login import (
     LoginDisconnect,
     LoginEncryptionRequest,
@@ -76,6 +77,15 @@ class TestLoginEncryptionRequest:
                     "4c3938a298da575e12e0ae178d61a69bc0ea0b381790f182d9dba715bfb503c99d92b0203010001049bd416ef"
                 ),
             ),
+            (
+                {"public_key": RSA_PUBLIC_KEY, "verify_token": bytes.fromhex("9bd416ef")},
+                bytes.fromhex(
+                    "142020202020202020202020202020202020202020a20130819f300d06092a864886f70d010101050003818d003081890"
+                    "2818100cb515109911ea3e4740d8a17a7ccd9cf226c83c7615e4a5505cd124571ee210a4ba26c7c42e15f51fcb7fa90dc"
+                    "e6f83ebe0e163817c7d9fb1af7d981e90da2cc06ea59d01ff9fbb76b1803a0fe5af4a2c75145d89eb03e6a4aae21d2e7d"
+                    "4c3938a298da575e12e0ae178d61a69bc0ea0b381790f182d9dba715bfb503c99d92b0203010001049bd416ef"
+                ),
+            ),
         ],
     )
     def test_serialize(self, kwargs: dict[str, Any], expected_bytes: bytes):
@@ -103,6 +113,21 @@ class TestLoginEncryptionRequest:
         for arg_name, val in expected_args.items():
             assert getattr(packet, arg_name) == val
 
+        # Serializing the deserialized packet should give back the same data
+        assert packet.serialize().flush() == bytearray(input_bytes)
+
+    def test_serialize_public_key_change(self):
+        """Test that changing the public key of an already serialized packet updates the serialized data."""
+        packet = LoginEncryptionRequest(public_key=RSA_PUBLIC_KEY, verify_token=bytes.fromhex("9bd416ef"))
+        original_data = packet.serialize().flush()
+        assert packet.serialize().flush() == original_data
+
+        packet.public_key = generate_rsa_key().public_key()
+        assert packet.serialize().flush() != original_data
+
+        packet.public_key = RSA_PUBLIC_KEY
+        assert packet.serialize().flush() == original_data
+
 
 class TestLoginEncryptionResponse:
     """Collection of tests for the LoginEncryptionResponse packet."""
@@ -259,7 +284,15 @@ class TestLoginPluginResponse:
             (
                 bytes.fromhex("000148656c6c6f"),
                 {"message_id": 0, "data": b"Hello"},
-            )
+            ),
+            (
+                bytes.fromhex("00ff48656c6c6f"),  # Any non-zero byte means the data is present (same as read_optional)
+                {"message_id": 0, "data": b"Hello"},
+            ),
+            (
+                bytes.fromhex("0000"),
+                {"message_id": 0, "data": None},
+            ),
         ],
     )
     def test_deserialize(self, input_bytes: bytes, expected_args: dict[str, Any]):
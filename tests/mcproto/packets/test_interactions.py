@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import zlib
+from typing import ClassVar, final
+
+import pytest
+from typing_extensions import Self, override
+
+from mcproto.buffer import Buffer
+from mcproto.packets.interactions import (
+    _deserialize_packet,
+    _encode_packet_id,
+    _serialize_packet_frame,
+    _serialize_packet_parts,
+    sync_read_packet,
+    sync_write_packet,
+)
+from mcproto.packets.packet import ClientBoundPacket, GameState, PacketDirection
+from mcproto.packets.packet_map import generate_packet_map
+from mcproto.packets.status.ping import PingPong
+from mcproto.packets.status.status import StatusResponse
+from mcproto.protocol.base_io import BaseSyncWriter
+
+STATUS_CLIENTBOUND = generate_packet_map(PacketDirection.CLIENTBOUND, GameState.STATUS)
+
+
+@pytest.mark.parametrize(
+    ("packet_id", "expected_bytes"),
+    [
+        (0x00, bytes.fromhex("00")),
+        (0x7F, bytes.fromhex("7f")),
+        (0x80, bytes.fromhex("8001")),
+        (0x1FF, bytes.fromhex("ff03")),
+    ],
+)
+def test_encode_packet_id(packet_id: int, expected_bytes: bytes):
+    """Test that the packet id is varint encoded, returning the same (cached) value on repeated calls."""
+    encoded = _encode_packet_id(packet_id)
+    assert encoded == expected_bytes
+    assert _encode_packet_id(packet_id) is encoded
+
+
+@pytest.mark.parametrize(
+    ("compression_threshold", "expected_bytes"),
+    [
+        (-1, bytes.fromhex("01000000000001e240")),
+        (256, bytes.fromhex("0001000000000001e240")),
+    ],
+)
+def test_serialize_packet_parts(compression_threshold: int, expected_bytes: bytes):
+    """Test serializing a packet along with its packet id (and data length when compression is enabled)."""
+    header, data = _serialize_packet_parts(PingPong(123456), compression_threshold=compression_threshold)
+    assert header + data == expected_bytes
+
+
+@pytest.mark.parametrize(
+    ("compression_threshold", "expected_bytes"),
+    [
+        (-1, bytes.fromhex("0901000000000001e240")),
+        (256, bytes.fromhex("0a0001000000000001e240")),
+    ],
+)
+def test_serialize_packet_frame(compression_threshold: int, expected_bytes: bytes):
+    """Test serializing a packet, prefixed with its length."""
+    buf = _serialize_packet_frame(PingPong(123456), compression_threshold=compression_threshold)
+    assert buf == bytearray(expected_bytes)
+
+
+@final
+class _StoredBufferPacket(ClientBoundPacket):
+    """Packet returning the same (stored) buffer from every serialize call."""
+
+    __slots__ = ("buf",)
+
+    PACKET_ID: ClassVar[int] = 0x03
+    GAME_STATE: ClassVar[GameState] = GameState.STATUS
+
+    def __init__(self, data: bytes):
+        self.buf = Buffer(data)
+
+    @override
+    def serialize(self) -> Buffer:
+        return self.buf
+
+    @override
+    @classmethod
+    def _deserialize(cls, buf: Buffer, /) -> Self:
+        return cls(buf.read(buf.remaining))
+
+
+@pytest.mark.parametrize("compression_threshold", [-1, 0, 256])
+def test_serialize_packet_keeps_packet_buffer(compression_threshold: int):
+    """Test that serializing doesn't modify the packet's buffer, so doing it repeatedly gives the same data."""
+    packet = _StoredBufferPacket(b"\x02hi")
+
+    first_data = _serialize_packet_frame(packet, compression_threshold=compression_threshold)
+    assert packet.buf == bytearray(b"\x02hi")
+
+    second_data = _serialize_packet_frame(packet, compression_threshold=compression_threshold)
+    assert packet.buf == bytearray(b"\x02hi")
+    assert second_data == first_data
+
+
+def test_serialize_packet_compressed():
+    """Test serializing a packet that crosses the compression threshold."""
+    header, data = _serialize_packet_parts(PingPong(123456), compression_threshold=2)
+    assert Buffer(header).read_varint() == 9
+    assert zlib.decompress(data) == bytes.fromhex("01000000000001e240")
+
+
+@pytest.mark.parametrize(
+    ("read_bytes", "compressed"),
+    [
+        (bytes.fromhex("01000000000001e240"), False),
+        (bytes.fromhex("0001000000000001e240"), True),
+        (bytes.fromhex("09") + zlib.compress(bytes.fromhex("01000000000001e240")), True),
+    ],
+)
+def test_deserialize_packet(read_bytes: bytes, compressed: bool):
+    """Test deserializing a packet, obtaining the packet class from the packet map."""
+    packet = _deserialize_packet(Buffer(read_bytes), STATUS_CLIENTBOUND, compressed=compressed)
+    assert isinstance(packet, PingPong)
+    assert packet.payload == 123456
+
+
+@pytest.mark.parametrize("compression_threshold", [-1, 0, 5, 1024])
+def test_write_read_packet(compression_threshold: int):
+    """Test that a packet written with ``sync_write_packet`` can be read back with ``sync_read_packet``."""
+    packet = StatusResponse({"description": {"text": "A Minecraft Server"}, "players": {"max": 20, "online": 0}})
+
+    buf = Buffer()
+    sync_write_packet(buf, packet, compression_threshold=compression_threshold)
+    sync_write_packet(buf, PingPong(42), compression_threshold=compression_threshold)
+
+    read_packet = sync_read_packet(buf, STATUS_CLIENTBOUND, compression_threshold=compression_threshold)
+    assert isinstance(read_packet, StatusResponse)
+    assert read_packet.data == packet.data
+
+    read_packet = sync_read_packet(buf, STATUS_CLIENTBOUND, compression_threshold=compression_threshold)
+    assert isinstance(read_packet, PingPong)
+    assert read_packet.payload == 42
+    assert buf.remaining == 0
+
+
+class _RecordingWriter(BaseSyncWriter):
+    """Writer storing the data from each of the write calls separately."""
+
+    __slots__ = ("writes",)
+
+    def __init__(self):
+        self.writes: list[bytes] = []
+
+    @override
+    def write(self, data: bytes, /) -> None:
+        self.writes.append(bytes(data))
+
+
+@pytest.mark.parametrize("compression_threshold", [-1, 0, 256])
+def test_write_packet_single_write(compression_threshold: int):
+    """Test that the whole packet (including the length prefix) is sent with a single write call."""
+    writer = _RecordingWriter()
+    sync_write_packet(writer, PingPong(123456), compression_threshold=compression_threshold)
+    assert len(writer.writes) == 1
+
+    buf = Buffer(writer.writes[0])
+    read_packet = sync_read_packet(buf, STATUS_CLIENTBOUND, compression_threshold=compression_threshold)
+    assert isinstance(read_packet, PingPong)
+    assert read_packet.payload == 123456
+
+
+@pytest.mark.parametrize("compression_threshold", [-1, 0, 256])
+def test_write_packet_keeps_packet_buffer(compression_threshold: int):
+    """Test that writing a packet returning a stored buffer sends the same data each time, without modifying it."""
+    packet = _StoredBufferPacket(b"\x02hi")
+    writer = _RecordingWriter()
+    sync_write_packet(writer, packet, compression_threshold=compression_threshold)
+    sync_write_packet(writer, packet, compression_threshold=compression_threshold)
+
+    assert packet.buf == bytearray(b"\x02hi")
+    assert writer.writes[0] == writer.writes[1]
+    assert writer.writes[0][0] == len(writer.writes[0]) - 1  # length prefix (single byte varint)
@@ -221,6 +221,10 @@ class WriterTests(ABC, Generic[T_WRITER]):
             (StructFormat.BYTE, 127, [127]),
             (StructFormat.BYTE, -20, [to_twos_complement(-20, bits=8)]),
             (StructFormat.BYTE, -128, [to_twos_complement(-128, bits=8)]),
+            (StructFormat.USHORT, 25565, [99, 221]),
+            (StructFormat.LONG, -2, [255, 255, 255, 254]),
+            (StructFormat.LONGLONG, 2806088, [0, 0, 0, 0, 0, 42, 209, 72]),
+            (StructFormat.DOUBLE, 1.5, [63, 248, 0, 0, 0, 0, 0, 0]),
         ],
     )
     def test_write_value(
@@ -432,6 +436,10 @@ class ReaderTests(ABC, Generic[T_READER]):
             (StructFormat.BYTE, [127], 127),
             (StructFormat.BYTE, [to_twos_complement(-20, bits=8)], -20),
             (StructFormat.BYTE, [to_twos_complement(-128, bits=8)], -128),
+            (StructFormat.USHORT, [99, 221], 25565),
+            (StructFormat.LONG, [255, 255, 255, 254], -2),
+            (StructFormat.LONGLONG, [0, 0, 0, 0, 0, 42, 209, 72], 2806088),
+            (StructFormat.DOUBLE, [63, 248, 0, 0, 0, 0, 0, 0], 1.5),
         ],
     )
     def test_read_value(
@@ -559,10 +567,11 @@ class ReaderTests(ABC, Generic[T_READER]):
         with pytest.raises(IOError):
             self.reader.read_utf()
 
-    def test_read_optional_true(self, method_mock: Mock | AsyncMock, read_mock: ReadFunctionMock):
-        """Test reading optional runs reader function when first bool is ``True``."""
+    @pytest.mark.parametrize("bool_byte", [1, 2, 255])
+    def test_read_optional_true(self, bool_byte: int, method_mock: Mock | AsyncMock, read_mock: ReadFunctionMock):
+        """Test reading optional runs reader function when first bool is ``True`` (any non-zero byte)."""
         mock_f = method_mock()
-        read_mock.combined_data = bytearray([1])
+        read_mock.combined_data = bytearray([bool_byte])
         self.reader.read_optional(mock_f)
         mock_f.assert_called_once_with()
 
@@ -101,6 +101,10 @@ def test_serialize_deserialize_end():
         (ListNBT, [], bytearray.fromhex("09 00 00 00 00 00")),
         (ListNBT, [ByteNBT(0)], bytearray.fromhex("09 01 00 00 00 01 00")),
         (ListNBT, [ShortNBT(127), ShortNBT(256)], bytearray.fromhex("09 02 00 00 00 02 00 7F 01 00")),
+        (ListNBT, [LongNBT(-1), LongNBT(2)], bytearray.fromhex("09 04 00 00 00 02") + struct.pack(">2q", -1, 2)),
+        (ListNBT, [FloatNBT(1.0), FloatNBT(-2.5)], bytearray.fromhex("09 05 00 00 00 02 3F 80 00 00 C0 20 00 00")),
+        (ListNBT, [DoubleNBT(3.14)], bytearray.fromhex("09 06 00 00 00 01") + struct.pack(">d", 3.14)),
+        (ListNBT, [StringNBT("a"), StringNBT("bc")], bytearray.fromhex("09 08 00 00 00 02 00 01") + b"a\x00\x02bc"),
         (
             ListNBT,
             [ListNBT([ByteNBT(0)]), ListNBT([IntNBT(256)])],
@@ -591,6 +595,17 @@ def test_serialize_deserialize_string_fail():
     with pytest.raises(ValueError):
         StringNBT("test", "").serialize()
 
+    # Within the character limit, but too many bytes (each character takes 2 bytes in UTF-8)
+    with pytest.raises(OverflowError):
+        StringNBT("é" * 20000).serialize(with_name=False)
+
+    with pytest.raises(OverflowError):
+        StringNBT("test", name="é" * 20000).serialize()
+
+    # Names go through the same character limit as the string payloads
+    with pytest.raises(ValueError, match="Maximum character limit"):
+        IntNBT(1, name="a" * 40000).serialize()
+
     # Deserialization
     buffer = Buffer(bytearray([0x01, 0, 0]))
     with pytest.raises(TypeError):  # Tries to read a StringNBT, but it's a ByteNBT
@@ -759,7 +774,7 @@ def test_deserialize_intarray_fail():
 
     # Not enough data for the size
     buffer = Buffer(bytearray([0x0B, 0, 0, 0]))
-    with pytest.raises(IOError):
+    with pytest.raises(IOError, match="Buffer does not contain enough data to read an int."):
         IntArrayNBT.read_from(buffer, with_name=False)
 
     # Not enough data to start the 2nd element
@@ -796,7 +811,7 @@ def test_deserialize_longarray_fail():
 
     # Not enough data for the size
     buffer = Buffer(bytearray([0x0C, 0, 0, 0]))
-    with pytest.raises(IOError):
+    with pytest.raises(IOError, match="Buffer does not contain enough data to read an int."):
         LongArrayNBT.read_from(buffer, with_name=False)
 
     # Not enough data to start the 2nd element
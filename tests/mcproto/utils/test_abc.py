@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import ClassVar
+
+import pytest
+
+from mcproto.utils.abc import RequiredParamsABCMixin
+
+
+class _Base(RequiredParamsABCMixin):
+    __slots__ = ()
+
+    _REQUIRED_CLASS_VARS: ClassVar[Sequence[str]] = ["FOO"]
+    _REQUIRED_CLASS_VARS_NO_MRO: ClassVar[Sequence[str]] = ["__slots__"]
+
+
+def test_required_class_vars_missing():
+    """Test initialization fails when a required class var isn't defined."""
+    with pytest.raises(TypeError, match="FOO"):
+        _Base()
+
+
+def test_required_class_vars_present():
+    """Test initialization works (repeatedly) when all required class vars are defined."""
+
+    class Concrete(_Base):
+        __slots__ = ()
+        FOO: ClassVar[int] = 1
+
+    assert isinstance(Concrete(), Concrete)
+    assert isinstance(Concrete(), Concrete)
+
+
+def test_required_class_vars_subclass_checked_separately():
+    """Test that a verified class doesn't make its subclasses skip the check."""
+
+    class Concrete(_Base):
+        __slots__ = ()
+        FOO: ClassVar[int] = 1
+
+    class ConcreteNoSlots(Concrete):
+        pass
+
+    Concrete()
+    with pytest.raises(TypeError, match="__slots__"):
+        ConcreteNoSlots()